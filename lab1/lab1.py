@@ -19,13 +19,69 @@ Output:     - Prints a list of group members received from the GCD.
             error message is printed.
 """
 
+import io
 import socket
 import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Define timeout
 TIMEOUT = 1.5
 
+# Pre-serialized constant messages (pickling the same literal per send is
+# wasted work); protocol 5 is faster and smaller than the default
+BEGIN_BYTES = pickle.dumps('BEGIN', protocol=pickle.HIGHEST_PROTOCOL)
+HELLO_BYTES = pickle.dumps('HELLO', protocol=pickle.HIGHEST_PROTOCOL)
+
+def _make_tcp_socket():
+    """
+    Create a TCP socket with Nagle's algorithm disabled.
+
+    Every exchange in this lab is a single small send followed by a
+    receive, so TCP_NODELAY avoids the Nagle/delayed-ACK stall that
+    would otherwise delay each message.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """
+    Unpickler that refuses to resolve any global. The responses we expect
+    are plain containers of strings, ints, and dicts, so a class reference
+    in the stream can only be an attempt to execute code on load.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            f"global '{module}.{name}' is forbidden in network data")
+
+def _safe_loads(data):
+    """Unpickle bytes received from the network without class loading."""
+    return _RestrictedUnpickler(io.BytesIO(data)).load()
+
+def _recv_pickled(sock, bufsize=4096):
+    """
+    Receive a pickled response that may span multiple TCP segments.
+
+    The GCD protocol has no length prefix, so accumulate chunks until the
+    bytes unpickle cleanly or the peer closes the connection; a single
+    recv() call may silently truncate larger responses. Unpickling is
+    restricted to plain data (no class loading).
+    """
+    data = b''
+    while True:
+        chunk = sock.recv(bufsize)
+        if not chunk:
+            break
+        data += chunk
+        try:
+            return _safe_loads(data)
+        except (pickle.UnpicklingError, EOFError, AttributeError,
+                IndexError, ValueError):
+            continue  # Incomplete pickle; keep reading
+    return _safe_loads(data)
+
 class GCDClient:
     def __init__(self, gcd_host, gcd_port):
         """Initialize the client with the GCD's host and port."""
@@ -39,16 +95,14 @@ class GCDClient:
         """
         try:
             # Create a TCP socket
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            with _make_tcp_socket() as sock:
                 sock.connect((self.gcd_host, self.gcd_port))
 
                 # Send the 'BEGIN' message
-                begin_message = pickle.dumps('BEGIN')
-                sock.sendall(begin_message)
+                sock.sendall(BEGIN_BYTES)
 
                 # Receive the response
-                data = sock.recv(1024)
-                self.group_members = pickle.loads(data)
+                self.group_members = _recv_pickled(sock)
                 print(f"Received group members: {self.group_members}")
 
         except Exception as e:
@@ -61,7 +115,7 @@ class GCDClient:
 
         try:
             # Create a TCP socket
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            with _make_tcp_socket() as sock:
                 # Set timeout
                 sock.settimeout(TIMEOUT)
 
@@ -69,12 +123,10 @@ class GCDClient:
                 sock.connect((host, port))
 
                 # Send the 'HELLO' message
-                hello_message = pickle.dumps('HELLO')
-                sock.sendall(hello_message)
+                sock.sendall(HELLO_BYTES)
 
                 # Receive the response
-                response = sock.recv(1024)
-                unpickled_response = pickle.loads(response)
+                unpickled_response = _recv_pickled(sock)
 
                 # Print the response
                 print(f"HELLO to {member} => {unpickled_response}")
@@ -88,13 +140,20 @@ class GCDClient:
             print(f"Failed to connect to {member}: {e}")
 
     def greet_group_members(self):
-        """Iterate over the list of group members and send 'HELLO' message."""
+        """
+        Send a 'HELLO' message to every group member in parallel.
+
+        Greetings run on a thread pool so an unreachable member only costs
+        its own TIMEOUT instead of stalling the whole run; each socket
+        already carries its own timeout.
+        """
         if not self.group_members:
             print("No group members found.")
             return
 
-        for member in self.group_members:
-            self.send_hello_to_member(member)
+        max_workers = min(32, len(self.group_members))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self.send_hello_to_member, self.group_members))
 
 def main():
     # Ensure proper usage
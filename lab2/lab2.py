@@ -28,22 +28,163 @@ Output:     - The program prints various log messages to the console, including:
               - Information about the leader and the current state of the network.
 """
 
+import bisect
+import io
+import selectors
 import socket
+import struct
 import threading
-import socketserver
 import pickle
 import time
 import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 
-class Lab2TCPServer(socketserver.ThreadingTCPServer):
+# Compact binary wire protocol for peer-to-peer messages. Pickle is slow,
+# unsafe to load from the network, and variable-size; the peer messages all
+# have fixed shapes, so they are framed as a 3-byte header (opcode +
+# payload length) followed by fixed struct records. The GCD protocol is
+# externally defined and stays pickled.
+MSG_ELECTION = 3
+MSG_OK = 4
+MSG_COORDINATOR = 5
+_MSG_NAMES = {MSG_ELECTION: 'ELECTION', MSG_OK: 'OK',
+              MSG_COORDINATOR: 'COORDINATOR'}
+_HEADER = struct.Struct('!BH')    # opcode, payload length
+_IDENTITY = struct.Struct('!iI')  # days to mother's birthday, SU ID
+_ADDR = struct.Struct('!4sH')     # IPv4 address + port
+
+def pack_message(opcode, identity=None, address=None):
+    """
+    Frame a peer message: header, then optional identity and address.
+
+    Args:
+        opcode (int): One of MSG_ELECTION, MSG_OK, MSG_COORDINATOR.
+        identity (tuple): (days, su_id) identity to include, if any.
+        address (tuple): (host, port) address to include, if any.
+
+    Returns:
+        bytes: The framed message ready to send.
+    """
+    payload = b''
+    if identity is not None:
+        payload += _IDENTITY.pack(*identity)
+    if address is not None:
+        host, port = address
+        ip_bytes = socket.inet_aton(socket.gethostbyname(host))
+        payload += _ADDR.pack(ip_bytes, port)
+    return _HEADER.pack(opcode, len(payload)) + payload
+
+def unpack_message(opcode, payload):
+    """
+    Decode a framed peer message payload into the same
+    (message_name, message_data, ...) tuple shape that handle_request
+    dispatches on.
+
+    Args:
+        opcode (int): The opcode from the frame header.
+        payload (bytes): The frame payload.
+
+    Returns:
+        tuple: The decoded message.
+    """
+    name = _MSG_NAMES.get(opcode)
+    if name == 'ELECTION':
+        identity = _IDENTITY.unpack_from(payload, 0)
+        ip_bytes, port = _ADDR.unpack_from(payload, _IDENTITY.size)
+        return ('ELECTION', identity, (socket.inet_ntoa(ip_bytes), port))
+    if name == 'COORDINATOR':
+        return ('COORDINATOR', _IDENTITY.unpack_from(payload, 0))
+    if name == 'OK':
+        return ('OK', None)
+    return (name,)
+
+# Pre-framed constant OK message (no payload)
+OK_BYTES = pack_message(MSG_OK)
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """
+    Unpickler that refuses to resolve any global. GCD responses are plain
+    containers of strings, ints, and tuples, so a class reference in the
+    stream can only be an attempt to execute code on load.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            f"global '{module}.{name}' is forbidden in network data")
+
+def _safe_loads(data):
+    """Unpickle bytes received from the network without class loading."""
+    return _RestrictedUnpickler(io.BytesIO(data)).load()
+
+def _recv_pickled(sock, bufsize=4096):
+    """
+    Receive a pickled response that may span multiple TCP segments.
+
+    The GCD protocol has no length prefix, so accumulate chunks until the
+    bytes unpickle cleanly or the peer closes the connection. Unpickling
+    is restricted to plain data (no class loading).
+
+    Args:
+        sock (socket.socket): The socket to read from.
+        bufsize (int): The chunk size for each recv call.
+
+    Returns:
+        The unpickled response object.
+    """
+    data = b''
+    while True:
+        chunk = sock.recv(bufsize)
+        if not chunk:
+            break
+        data += chunk
+        try:
+            return _safe_loads(data)
+        except (pickle.UnpicklingError, EOFError, AttributeError,
+                IndexError, ValueError):
+            continue  # Incomplete pickle; keep reading
+    return _safe_loads(data)
+
+# Control messages are tiny, so the kernel's default send/receive buffers
+# would over-allocate per pooled connection
+_CTRL_SOCK_BUFSIZE = 8192
+
+def _make_tcp_socket():
+    """
+    Create a TCP socket tuned for small, long-lived control connections.
+
+    Every election message is a single small send; TCP_NODELAY avoids the
+    Nagle/delayed-ACK stall that would otherwise add latency to each one.
+    Address reuse keeps election storms from exhausting ephemeral ports on
+    TIME_WAIT sockets, and keepalive probes let the pool notice a silently
+    dead peer instead of caching its connection forever.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, 'SO_REUSEPORT'):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux-only keepalive tuning
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _CTRL_SOCK_BUFSIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _CTRL_SOCK_BUFSIZE)
+    return sock
+
+class Lab2TCPServer:
     """
     This class represents a TCP server that is used to manage communication
-    between nodes participating in the Bully algorithm. It inherits from
-    `socketserver.ThreadingTCPServer`, allowing each client request to be
-    handled in a separate thread. This class encapsulates all functionalities
+    between nodes participating in the Bully algorithm. All network I/O is
+    multiplexed on a single selectors-based event loop: each incoming
+    message is tens of bytes, so spawning an OS thread per request (the
+    ThreadingTCPServer model) cost far more than the handling itself.
+    Decoded messages are handed to a small dispatch pool, since handlers
+    such as start_election block waiting on OK/COORDINATOR events and must
+    not stall the I/O loop. This class encapsulates all functionalities
     related to client management, elections, and leader coordination.
 
     Attributes:
@@ -55,35 +196,139 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
                             in an election.
         current_leader (tuple or None): The identity of the current leader node.
         members (dict):     A dictionary of other group members in the form
-                            {identity: (host, port)}.
+                            {identity: (host, port)}. Treated as immutable
+                            copy-on-write state: writers rebind the
+                            attribute to a fresh dict under `lock`, so
+                            readers can take a snapshot without locking
+                            (attribute rebinding is atomic under the GIL).
+        conn_pool (dict):   A cache of long-lived outbound sockets in the
+                            form {(host, port): socket}, so repeated
+                            messages to the same peer reuse one connection
+                            instead of paying a 3-way handshake each time.
         lock (threading.Lock):  A lock to ensure thread-safe access to
                                 shared data structures like `members`.
     """
 
-    allow_reuse_address = True
-
-    def __init__(self, server_address, RequestHandlerClass, gcd_host, gcd_port, identity):
+    def __init__(self, server_address, gcd_host, gcd_port, identity):
         """
-        Initialize the Lab2TCPServer instance, setting up the server and
-        initializing its attributes.
+        Initialize the Lab2TCPServer instance, setting up the listening
+        socket and the selector loop state.
 
         Args:
             server_address (tuple): The address on which the server will bind.
-            RequestHandlerClass (class):    The handler class used to manage
-                                            incoming requests.
             gcd_host (str):         Hostname of the GCD server.
             gcd_port (int):         Port number of the GCD server.
             identity (tuple):       The unique identity of this node.
         """
 
-        super().__init__(server_address, RequestHandlerClass)
+        self.listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listen_sock.bind(server_address)
+        self.listen_sock.listen()
+        self.listen_sock.setblocking(False)
+        self.server_address = self.listen_sock.getsockname()
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listen_sock, selectors.EVENT_READ,
+                               self._accept)
+        self._rx_buffers = {}   # {socket: bytearray of undecoded bytes}
+        self._peer_addrs = {}   # {socket: (host, port) of the peer}
+        self._shutdown_event = threading.Event()
+        # Handlers may block (waiting for OK/COORDINATOR), so they run off
+        # the selector thread on a small pool
+        self.dispatch_pool = ThreadPoolExecutor(max_workers=8)
+
         self.gcd_host = gcd_host
         self.gcd_port = gcd_port
         self.identity = identity  # (days_to_next_mother's_birthday, su_id)
         self.in_election = False
         self.current_leader = None
         self.members = {}  # {identity: (host, port)}
+        self._sorted_idents = []  # members' identities, kept sorted
+        self.conn_pool = {}  # {(host, port): socket}
+        self.send_pool = ThreadPoolExecutor(max_workers=32)  # For parallel fan-out
         self.lock = threading.Lock()  # For thread-safe operations
+        # Identity never changes, so the COORDINATOR message can be
+        # serialized once up front
+        self._coord_bytes = pack_message(MSG_COORDINATOR, self.identity)
+        # The GCD registration message is likewise fixed once the listen
+        # address is bound, so pickle it a single time; protocol 5 is
+        # considerably faster than the default for small tuples
+        self._begin_bytes = pickle.dumps(
+            ('BEGIN', (self.identity, self.server_address)),
+            protocol=pickle.HIGHEST_PROTOCOL)
+        # O(1) message dispatch table (an if/elif chain over the message
+        # names costs one string compare per opcode per message)
+        self._dispatch = {
+            'ELECTION': self._do_election,
+            'COORDINATOR': self._do_coordinator,
+            'OK': self._do_ok,
+        }
+
+    def serve_forever(self):
+        """
+        Run the selector event loop until shutdown() is called, accepting
+        peers and reading framed messages as they become readable.
+        """
+        while not self._shutdown_event.is_set():
+            events = self.selector.select(timeout=0.5)
+            for key, _ in events:
+                key.data(key.fileobj)
+
+    def shutdown(self):
+        """Ask the selector loop to exit."""
+        self._shutdown_event.set()
+
+    def _accept(self, listen_sock):
+        """Accept a new peer connection and register it with the selector."""
+        conn, addr = listen_sock.accept()
+        conn.setblocking(False)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._rx_buffers[conn] = bytearray()
+        self._peer_addrs[conn] = addr
+        self.selector.register(conn, selectors.EVENT_READ, self._read_frames)
+
+    def _read_frames(self, conn):
+        """
+        Read whatever the peer has sent, buffering partial frames, and
+        dispatch each complete message to the handler pool.
+        """
+        peer_address = self._peer_addrs[conn]
+        try:
+            data = conn.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logging.error(f"Error reading from {peer_address}: {e}")
+            data = b''
+        if not data:
+            self._close_peer(conn)
+            return
+
+        buf = self._rx_buffers[conn]
+        buf += data
+        while len(buf) >= _HEADER.size:
+            opcode, length = _HEADER.unpack_from(buf)
+            frame_end = _HEADER.size + length
+            if len(buf) < frame_end:
+                break  # Wait for the rest of the frame
+            payload = bytes(buf[_HEADER.size:frame_end])
+            del buf[:frame_end]
+            try:
+                message = unpack_message(opcode, payload)
+            except struct.error as e:
+                logging.error(f"Bad frame from {peer_address}: {e}")
+                self._close_peer(conn)
+                return
+            logging.info(f"Received {message[0]} message from {peer_address}")
+            self.dispatch_pool.submit(self.handle_request, message)
+
+    def _close_peer(self, conn):
+        """Unregister and close a peer connection."""
+        self.selector.unregister(conn)
+        del self._rx_buffers[conn]
+        del self._peer_addrs[conn]
+        conn.close()
 
     def connect_to_gcd(self):
         """
@@ -92,23 +337,130 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
         node and get the updated members list.
         """
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            with _make_tcp_socket() as s:
                 s.settimeout(5)
                 s.connect((self.gcd_host, self.gcd_port))
                 logging.info(f"Connecting to GCD at {self.gcd_host}:{self.gcd_port}")
-                begin_message = ('BEGIN', (self.identity, self.server_address))
-                s.sendall(pickle.dumps(begin_message))
-                response = s.recv(4096)
-                response_data = pickle.loads(response)
+                s.sendall(self._begin_bytes)
+                response_data = _recv_pickled(s)
             if isinstance(response_data, dict):
                 with self.lock:
-                    self.members = response_data
+                    # Rebind to a fresh dict rather than mutating in place,
+                    # so concurrent readers keep a consistent snapshot; keep
+                    # the identity ordering alongside so elections can slice
+                    # out higher members instead of scanning
+                    self.members = dict(response_data)
+                    self._sorted_idents = sorted(self.members)
                 logging.info(f"Members received from GCD: {self.members}")
             else:
                 logging.info(f"Unexpected response from GCD: {response_data}")
         except Exception as e:
             logging.error(f"Failed to connect to GCD: {e}")
 
+    def _get_conn(self, addr):
+        """
+        Return a pooled outbound socket connected to the given address,
+        dialing and caching a new one if none exists yet.
+
+        Args:
+            addr (tuple): The (host, port) address of the peer.
+
+        Returns:
+            socket.socket: A connected TCP socket to the peer.
+        """
+        with self.lock:
+            sock = self.conn_pool.get(addr)
+        if sock is not None:
+            return sock
+        sock = _make_tcp_socket()
+        sock.settimeout(5)
+        sock.connect(addr)
+        with self.lock:
+            # Two threads can race past the miss and both dial; keep
+            # whichever socket won the pool and close the loser so it is
+            # not leaked
+            pooled = self.conn_pool.get(addr)
+            if pooled is None:
+                self.conn_pool[addr] = sock
+                return sock
+        try:
+            sock.close()
+        except OSError:
+            pass
+        return pooled
+
+    def _evict_conn(self, addr):
+        """
+        Drop the pooled socket for the given address, closing it if present.
+
+        Args:
+            addr (tuple): The (host, port) address of the peer.
+        """
+        with self.lock:
+            sock = self.conn_pool.pop(addr, None)
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def _send_message(self, addr, payload):
+        """
+        Send a serialized message to a peer over its pooled connection.
+        If the cached socket has gone stale (peer closed it), evict it and
+        retry once on a fresh connection.
+
+        Args:
+            addr (tuple): The (host, port) address of the peer.
+            payload (bytes): The serialized message to send.
+        """
+        try:
+            self._get_conn(addr).sendall(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            self._evict_conn(addr)
+            self._get_conn(addr).sendall(payload)
+
+    def _send_to_all(self, label, recipients, payload):
+        """
+        Fan a pre-serialized message out to many peers in parallel.
+
+        Sends are submitted to the send_pool so an unreachable peer only
+        costs its own connect timeout instead of serializing the whole
+        broadcast. Blocks until every send has completed or failed.
+
+        Args:
+            label (str): Message name, used only for logging.
+            recipients (dict): {identity: (host, port)} peers to contact.
+            payload (bytes): The serialized message to send to each peer.
+        """
+        def send_one(ident, addr):
+            try:
+                self._send_message(addr, payload)
+                logging.info(f"Sent {label} message to {ident} at {addr}")
+            except Exception as e:
+                logging.error(f"Failed to send {label} to {ident} at {addr}: {e}")
+
+        futures = [self.send_pool.submit(send_one, ident, addr)
+                   for ident, addr in recipients.items()]
+        for future in futures:
+            future.result()
+
+    def server_close(self):
+        """Close all sockets, the selector, and the worker pools."""
+        self.send_pool.shutdown(wait=False)
+        self.dispatch_pool.shutdown(wait=False)
+        with self.lock:
+            pool, self.conn_pool = self.conn_pool, {}
+        for sock in pool.values():
+            try:
+                sock.close()
+            except OSError:
+                pass
+        for conn in list(self._rx_buffers):
+            self._close_peer(conn)
+        self.selector.close()
+        self.listen_sock.close()
+
     def start_election(self):
         """
         Start an election by sending 'ELECTION' messages to all higher
@@ -124,27 +476,32 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
 
         self.connect_to_gcd()  # Get the latest members list
 
-        with self.lock:
-            # Select members with higher identities
-            higher_members = {ident: addr for ident, addr in self.members.items() if ident > self.identity}
+        # Lock-free read: members is rebound atomically, never mutated
+        members = self.members
+        # Identities are kept sorted on each refresh, so the higher members
+        # are just the tail slice past our own identity
+        idents = self._sorted_idents
+        higher = idents[bisect.bisect_right(idents, self.identity):]
+        higher_members = {ident: members[ident] for ident in higher
+                          if ident in members}
 
         if not higher_members:
             logging.info("No higher members found. Declaring self as leader.")
             self.declare_leader()
         else:
             logging.info(f"Higher members found: {higher_members.keys()}")
-            # Send ELECTION message to higher members
-            for ident, addr in higher_members.items():
-                try:
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                        s.settimeout(5)
-                        s.connect(addr)
-                        election_message = ('ELECTION', self.identity,
-                                            self.members)
-                        s.sendall(pickle.dumps(election_message))
-                        logging.info(f"Sent ELECTION message to {ident} at {addr}")
-                except Exception as e:
-                    logging.error(f"Failed to send ELECTION to {ident} at {addr}: {e}")
+            # Serialize once, then send ELECTION to higher members in
+            # parallel. Only our identity and reply address go on the wire;
+            # receivers refresh the membership from the GCD themselves, so
+            # there is no point shipping the whole members dict n times.
+            election_bytes = pack_message(MSG_ELECTION, self.identity,
+                                          self.server_address)
+            # Arm the OK event before anything goes on the wire: the
+            # selector loop handles inbound frames while the fan-out is
+            # still in flight, so a fast peer's OK could otherwise arrive
+            # before the event exists and be dropped
+            self.received_ok_event = threading.Event()
+            self._send_to_all('ELECTION', higher_members, election_bytes)
             # Wait for OK messages
             self.handle_ok()
 
@@ -152,10 +509,10 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
         """
         Wait for an 'OK' message from a higher node or time out to declare
         itself as the leader. If an 'OK' message is received, the node
-        waits for a 'COORDINATOR' message from the new leader.
+        waits for a 'COORDINATOR' message from the new leader. The event
+        waited on is armed by start_election before the ELECTION fan-out.
         """
         timeout = 5  # seconds
-        self.received_ok_event = threading.Event()
 
         logging.info("Waiting for OK message or timeout...")
 
@@ -180,32 +537,24 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
         else:
             logging.info("Received OK message, but no event to set.")
 
-    def handle_election(self, sender_identity, sender_address, sender_members):
+    def handle_election(self, sender_identity, sender_address):
         """
         Handle receipt of an 'ELECTION' message. The node responds with
         an 'OK' message to the sender and starts its own election if
-        not already in one.
+        not already in one. The membership view is refreshed from the GCD
+        when our own election starts, so the sender does not need to ship
+        its members list.
 
         Args:
             sender_identity (tuple): The identity of the node that sent the election message.
             sender_address (tuple): The address of the sender node.
-            sender_members (dict): The members list from the sender node.
         """
         logging.info(f"Received ELECTION message from {sender_identity} at {sender_address}")
 
-        with self.lock:
-            # Update members list with sender's members
-            self.members.update(sender_members)
-            logging.info(f"Updated members list with sender's members: {self.members}")
-
         # Send back OK message to sender
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(5)
-                s.connect(sender_address)
-                ok_message = ('OK', None)
-                s.sendall(pickle.dumps(ok_message))
-                logging.info(f"Sent OK message to {sender_identity} at {sender_address}")
+            self._send_message(sender_address, OK_BYTES)
+            logging.info(f"Sent OK message to {sender_identity} at {sender_address}")
         except Exception as e:
             logging.error(f"Failed to send OK to {sender_identity} at {sender_address}: {e}")
 
@@ -227,20 +576,12 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
         # Uncomment the following line to introduce a delay for testing purposes
         # time.sleep(10)  # Introduce delay before sending COORDINATOR messages
 
-        # Send COORDINATOR message to all members except self
-        for ident, addr in self.members.items():
-            if ident == self.identity:
-                continue
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(5)
-                    s.connect(addr)
-                    coordinator_message = ('COORDINATOR', self.identity)
-                    s.sendall(pickle.dumps(coordinator_message))
-                    logging.info(f"Sent COORDINATOR message to {ident} at {addr}")
-            except Exception as e:
-                logging.error(f"Failed to send COORDINATOR to {ident} at {addr}: {e}")
-                continue
+        # Send COORDINATOR message to all members except self, in parallel
+        # (lock-free snapshot of the copy-on-write members dict)
+        members = self.members
+        recipients = {ident: addr for ident, addr in members.items()
+                      if ident != self.identity}
+        self._send_to_all('COORDINATOR', recipients, self._coord_bytes)
 
     def handle_leader(self, new_leader_identity):
         """
@@ -282,50 +623,32 @@ class Lab2TCPServer(socketserver.ThreadingTCPServer):
             # Start a new election
             self.start_election()
 
+    def _do_election(self, message):
+        """Unpack an ('ELECTION', identity, address) message and handle it."""
+        self.handle_election(message[1], message[2])
+
+    def _do_coordinator(self, message):
+        """Unpack a ('COORDINATOR', identity) message and handle it."""
+        self.handle_leader(message[1])
+
+    def _do_ok(self, message):
+        """Handle an ('OK', None) message."""
+        self.handle_ok_received()
+
     def handle_request(self, message):
         """
         Handle incoming messages by routing them to the appropriate handler
-        based on the message type.
+        via a single dict lookup on the message type.
 
         Args:
             message (tuple): The incoming message, which consists of
-                             (message_name, message_data, members_data).
-        """
-        message_name = message[0]
-        message_data = message[1] if len(message) > 1 else None
-        members_data = message[2] if len(message) > 2 else None
-
-        if message_name == 'ELECTION':
-            sender_identity = message_data
-            sender_address = members_data.get(sender_identity)
-            self.handle_election(sender_identity, sender_address, members_data)
-        elif message_name == 'COORDINATOR':
-            new_leader_identity = message_data
-            self.handle_leader(new_leader_identity)
-        elif message_name == 'OK':
-            self.handle_ok_received()
-        else:
-            logging.info(f"Unknown message type: {message_name}")
-
-class Lab2TCPRequestHandler(socketserver.BaseRequestHandler):
-    """
-    The request handler for the TCP server. This class handles the actual
-    processing of incoming messages for each client in a separate thread.
-
-    Methods:
-        handle(): Receives and processes the incoming request.
-    """
-
-    def handle(self):
-        peer_address = self.client_address
-        try:
-            data = self.request.recv(4096)
-            message = pickle.loads(data)
-            logging.info(f"Received {message[0]} message from {peer_address}")
-            self.server.handle_request(message)
-        except Exception as e:
-            logging.error(
-                f"Exception while handling message from {peer_address}: {e}")
+                             (message_name, message_data, sender_address).
+        """
+        handler = self._dispatch.get(message[0])
+        if handler is None:
+            logging.info(f"Unknown message type: {message[0]}")
+            return
+        handler(message)
 
 if __name__ == "__main__":
     # Set up logging with timestamps
@@ -367,7 +690,7 @@ if __name__ == "__main__":
 
     HOST, PORT = 'localhost', 0  # Bind to localhost and let the OS choose an available port
 
-    server = Lab2TCPServer((HOST, PORT), Lab2TCPRequestHandler, gcd_host, gcd_port, identity)
+    server = Lab2TCPServer((HOST, PORT), gcd_host, gcd_port, identity)
     HOST, PORT = server.server_address  # Get the dynamically assigned port
 
     # Start the server in a separate thread
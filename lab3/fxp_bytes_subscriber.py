@@ -13,7 +13,46 @@ import socket
 import struct
 from datetime import datetime, timedelta
 
+import numpy as np
+
 MICROS_PER_SECOND = 1_000_000
+RECORD_SIZE = 32
+
+# Structured view of one 32-byte quote record (layout documented in
+# unmarshal_message). Lets NumPy decode a whole datagram in C instead of
+# slicing and unpacking each record in the interpreter.
+DTYPE = np.dtype([('ca', 'S3'), ('cb', 'S3'), ('price', '<f4'),
+                  ('ts', '>u8'), ('_pad', 'V14')])
+
+_EPOCH = np.datetime64(0, 'us')
+
+# Precompiled layout of a subscription request: 4-byte IPv4 address plus
+# 2-byte port, both big-endian (network order)
+_ADDR_STRUCT = struct.Struct('!4sH')
+
+# Precompiled little-endian binary32 price format, so the scalar helper
+# does not re-parse the format string on every call
+_PRICE_STRUCT = struct.Struct('<f')
+
+# Field view used to assemble 'AAA/BBB' cross strings as fixed-width
+# 7-byte blocks (3 + 1 + 3) without any per-row Python work
+_COMBO_DTYPE = np.dtype([('ca', 'S3'), ('sep', 'S1'), ('cb', 'S3')])
+
+def _cross_strings(arr):
+    """
+    Build the 'AAA/BBB' cross string for every record of a decoded quote
+    array in one vectorized pass: write the two codes and the separator
+    into a contiguous 7-byte column, then cast the whole column to str.
+
+    :param arr: structured array of quote records (DTYPE)
+    :return: list of cross strings, one per record
+    """
+    combo = np.empty(len(arr), dtype='S7')
+    view = combo.view(_COMBO_DTYPE)
+    view['ca'] = arr['ca']
+    view['sep'] = b'/'
+    view['cb'] = arr['cb']
+    return combo.astype(str).tolist()
 
 def serialize_address(address):
     """
@@ -27,9 +66,7 @@ def serialize_address(address):
     :return: bytes
     """
     ip_str, port = address
-    ip_bytes = socket.inet_aton(ip_str)  # Convert IP to 4-byte binary
-    port_bytes = port.to_bytes(2, byteorder='big')  # Port number in big-endian
-    return ip_bytes + port_bytes
+    return _ADDR_STRUCT.pack(socket.inet_aton(ip_str), port)
 
 def deserialize_price(price_bytes):
     """
@@ -38,11 +75,55 @@ def deserialize_price(price_bytes):
     :param price_bytes: 4-byte little-endian float
     :return: float price
     """
-    # '<f' format specifier for little-endian float
-    price = struct.unpack('<f', price_bytes)[0]
-    return price
+    return _PRICE_STRUCT.unpack(price_bytes)[0]
+
+def to_datetime(micros_since_epoch):
+    """
+    Convert an integer number of microseconds since the UTC epoch into a
+    datetime, for the few call sites that need one.
 
-def unmarshal_message(message):
+    :param micros_since_epoch: microseconds since 1970-01-01 00:00:00 UTC
+    :return: naive UTC datetime
+    """
+    return datetime(1970, 1, 1) + timedelta(microseconds=micros_since_epoch)
+
+def unmarshal_arrays(message, as_datetime=True):
+    """
+    Parse a Forex Provider message into one column per field instead of
+    one dictionary per quote, so a consumer keeping its own per-pair
+    arrays can ingest a datagram without allocating any per-quote
+    containers.
+
+    Same wire format and buffer-protocol handling as unmarshal_message
+    (which is now a thin wrapper around this function).
+
+    >>> r = b'GBPUSDe6\\x9c?\\x00\\x04\\tT\\xdd5@\\x00' + bytes(14)
+    >>> crosses, prices, times = unmarshal_arrays(r)
+    >>> crosses, round(float(prices[0]), 5), times[0]
+    (['GBP/USD'], 1.22041, datetime.datetime(2006, 1, 2, 0, 0))
+
+    :param message: byte stream received from the Forex Provider
+    :param as_datetime: as in unmarshal_message; when False, times is an
+                        int64 array of microseconds since the epoch
+    :return: (crosses, prices, times) — list of cross strings, float64
+             array of prices, and a list of datetimes (or int64 array)
+    """
+    num_quotes = len(message) // RECORD_SIZE
+    if num_quotes == 0:
+        return [], np.empty(0), []
+    arr = np.frombuffer(message, dtype=DTYPE, count=num_quotes)
+
+    # Decode every column in one vectorized pass
+    crosses = _cross_strings(arr)
+    prices = arr['price'].astype(np.float64)
+    ts_micros = arr['ts'].astype('i8')
+    if as_datetime:
+        times = (_EPOCH + ts_micros.astype('timedelta64[us]')).tolist()
+    else:
+        times = ts_micros
+    return crosses, prices, times
+
+def unmarshal_message(message, as_datetime=True):
     """
     Parse the byte stream received in a Forex Provider message into a list of quote dictionaries.
 
@@ -53,30 +134,27 @@ def unmarshal_message(message):
     - Bytes 10-17: Timestamp (8-byte big-endian unsigned long long)
     - Bytes 18-31: Reserved (14 bytes, ignored)
 
+    Parsing reads straight out of the caller's buffer (np.frombuffer with
+    an explicit record count), so no per-record slices are allocated and
+    any object supporting the buffer protocol (bytes, bytearray,
+    memoryview) is accepted.
+
+    >>> r = b'GBPUSDe6\\x9c?\\x00\\x04\\tT\\xdd5@\\x00' + bytes(14)
+    >>> q = unmarshal_message(r)[0]
+    >>> q['cross'], round(q['price'], 5), q['time']
+    ('GBP/USD', 1.22041, datetime.datetime(2006, 1, 2, 0, 0))
+    >>> unmarshal_message(memoryview(bytearray(r)))[0] == q  # zero-copy view
+    True
+
     :param message: byte stream received from the Forex Provider
+    :param as_datetime: when False, 'time' is left as integer microseconds
+                        since the epoch (cheap to compare and sort) instead
+                        of being boxed into a datetime; use to_datetime()
+                        where an actual datetime is needed
     :return: list of quote dictionaries with 'cross', 'price', 'time'
     """
-    quotes = []
-    record_size = 32
-    num_quotes = len(message) // record_size
-    for i in range(num_quotes):
-        offset = i * record_size
-        record = message[offset:offset + record_size]
-
-        # Currencies
-        curr_a = record[0:3].decode('ascii')
-        curr_b = record[3:6].decode('ascii')
-        cross = f"{curr_a}/{curr_b}"
-
-        # Exchange rate
-        price_bytes = record[6:10]
-        price = deserialize_price(price_bytes)
-
-        # Timestamp
-        timestamp_bytes = record[10:18]
-        micros_since_epoch = int.from_bytes(timestamp_bytes, byteorder='big')
-        timestamp = datetime(1970, 1, 1) + timedelta(microseconds=micros_since_epoch)
-
-        quote = {'cross': cross, 'price': price, 'time': timestamp}
-        quotes.append(quote)
-    return quotes
\ No newline at end of file
+    crosses, prices, times = unmarshal_arrays(message, as_datetime)
+    if not as_datetime and len(crosses):
+        times = times.tolist()
+    return [{'cross': cross, 'price': price, 'time': timestamp}
+            for cross, price, timestamp in zip(crosses, prices.tolist(), times)]
\ No newline at end of file
@@ -11,13 +11,28 @@ Output:    Printed exchange rates received from the publisher, arbitrage opportu
 
 import socket
 import fxp_bytes_subscriber
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 import math
 import time
 from bellman_ford import BellmanFord
 import sys
 
-QUOTE_EXPIRY = timedelta(seconds=1.5)  # Define the quote expiry time
+import numpy as np
+
+QUOTE_EXPIRY_US = 1_500_000  # Quote expiry time, in microseconds
+SUBSCRIPTION_EXPIRY = 600    # Publisher subscription lifetime, in seconds
+_INITIAL_CAPACITY = 64       # Starting size of the per-pair arrays
+
+@dataclass(slots=True)
+class Quote:
+    """
+    Latest quote for one currency pair. Slotted so the hundreds of live
+    records stay small (no per-instance __dict__) and their fields sit
+    densely for the loops that walk every pair.
+    """
+    price: float
+    pair: tuple
+    display: str
 
 class ForexSubscriber:
     """
@@ -26,6 +41,11 @@ class ForexSubscriber:
     opportunities using the Bellman-Ford algorithm.
     """
 
+    __slots__ = ('publisher_port', 'REQUEST_ADDRESS', 'sock',
+                 'local_address', 'rxbuf', 'quotes_dict',
+                 'latest_timestamps', 'bf', 'pair_id', 'pair_list',
+                 'ts', 'last_message_time')
+
     def __init__(self, publisher_port):
         """
         Initialize the ForexSubscriber.
@@ -43,6 +63,10 @@ class ForexSubscriber:
             quotes.
             self.latest_timestamps: Dictionary to track the latest timestamp
             for each currency pair.
+            self.bf: The currency graph, maintained incrementally as quotes
+            arrive and expire.
+            self.pair_id / self.pair_list / self.ts: Per-pair slot
+            registry and the parallel timestamp array.
             self.last_message_time: Timestamp of the last received message.
         """
 
@@ -52,14 +76,52 @@ class ForexSubscriber:
         # Create a UDP socket to receive messages
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.bind(('localhost', 0))
-        self.sock.settimeout(10)  # Set a timeout for receiving messages
+        # A 1s receive timeout paces the main loop: the blocking recv is
+        # the idle wait, so no explicit sleep is needed between ticks
+        self.sock.settimeout(1.0)
         self.local_address = self.sock.getsockname()
+        # Reused receive buffer: recvfrom_into fills it in place, so no
+        # bytes object is allocated per datagram
+        self.rxbuf = bytearray(4096)
 
         self.quotes_dict = {}        # To store the latest quotes
         self.latest_timestamps = {}  # To track the latest timestamp for each market
+        self.bf = BellmanFord()      # Currency graph, updated in place per quote
+
+        # Each cross gets a stable integer id, and the latest timestamps
+        # live in an array indexed by that id, so the stale sweep is one
+        # vectorized compare instead of a per-entry Python loop. A
+        # timestamp of -inf marks an inactive slot.
+        self.pair_id = {}            # {cross: id}
+        self.pair_list = []          # id -> cross
+        self.ts = np.full(_INITIAL_CAPACITY, -np.inf)
+
+        # Initialize other necessary variables (monotonic clock: immune to
+        # wall-clock jumps and cheaper than datetime arithmetic)
+        self.last_message_time = time.monotonic()
+
+    def _pair_index(self, cross):
+        """
+        Return the array slot for a currency cross, registering the cross
+        (and doubling the timestamp array if it is full) the first time
+        it is seen.
 
-        # Initialize other necessary variables
-        self.last_message_time = datetime.utcnow()
+        Parameters:
+            cross (str): Currency pair, e.g. 'GBP/USD'.
+
+        Returns:
+            pid (int): Index into self.ts.
+        """
+
+        pid = self.pair_id.get(cross)
+        if pid is None:
+            pid = len(self.pair_list)
+            self.pair_id[cross] = pid
+            self.pair_list.append(cross)
+            if pid >= len(self.ts):
+                self.ts = np.resize(self.ts, 2 * len(self.ts))
+                self.ts[pid:] = -np.inf
+        return pid
 
     def send_subscribe(self):
         """
@@ -79,91 +141,117 @@ class ForexSubscriber:
         Receive messages (exchange rate quotes) from the publisher.
 
         Returns:
-            quotes (list): A list of quote dictionaries received from the publisher.
-                           Each quote contains 'cross', 'price', and 'time'.
+            (crosses, prices, times): One column per quote field, as
+            produced by fxp_bytes_subscriber.unmarshal_arrays — no
+            per-quote dictionaries are allocated on the receive path.
 
-        If no message is received before the timeout, an empty list is returned.
+        If no message is received before the timeout, empty columns are
+        returned.
         """
 
         try:
-            message, addr = self.sock.recvfrom(4096)
-            quotes = fxp_bytes_subscriber.unmarshal_message(message)
-            return quotes
+            nbytes, addr = self.sock.recvfrom_into(self.rxbuf)
+            # Timestamps stay integer microseconds on this path; they are
+            # only boxed into datetimes at the point of display
+            return fxp_bytes_subscriber.unmarshal_arrays(
+                memoryview(self.rxbuf)[:nbytes], as_datetime=False)
         except socket.timeout:
-            return []
+            return [], np.empty(0), np.empty(0, dtype='i8')
 
-    def process_quotes(self, quotes):
+    def process_quotes(self, crosses, prices, times):
         """
         Process received exchange rate quotes, updating the quotes dictionary and timestamps.
 
         Parameters:
-            quotes (list): A list of quote dictionaries to process.
+            crosses (list): Cross strings, one per quote.
+            prices (ndarray): Prices, parallel to crosses.
+            times (ndarray): int64 timestamps in microseconds since the
+                             epoch, parallel to crosses.
 
         The method:
             - Checks for out-of-sequence messages and ignores them.
             - Updates the latest timestamp for each currency pair.
             - Prints the received quote.
             - Updates the quotes dictionary with the new quote.
-        """
 
-        for quote in quotes:
-            cross = quote['cross']
-            price = quote['price']
-            timestamp = quote['time']
+        The logs of all the prices are taken in one vectorized call up
+        front; the per-quote loop then only does dict updates. Output is
+        collected into a batch and written to stdout once per datagram,
+        instead of one flushing print per quote.
+        """
 
-            # Check for out-of-sequence messages
+        log_prices = np.log(prices)
+        to_datetime = fxp_bytes_subscriber.to_datetime
+        lines = []
+        for cross, price, timestamp, log_price in zip(
+                crosses, prices.tolist(), times.tolist(),
+                log_prices.tolist()):
+            # The display string and split pair only depend on the cross,
+            # so a repeat quote reuses the previous record's copies
+            prev = self.quotes_dict.get(cross)
+            if prev is not None:
+                display = prev.display
+                pair = prev.pair
+            else:
+                display = cross.replace('/', ' ')
+                # Intern the codes once per new cross: every later dict
+                # probe on them (BellmanFord vertices, edges, SPFA
+                # bookkeeping) then hits CPython's pointer-identity fast
+                # path instead of hashing a fresh 3-char string
+                curr_a, curr_b = cross.split('/')
+                pair = (sys.intern(curr_a), sys.intern(curr_b))
+
+            # Check for out-of-sequence messages (plain integer compare)
             if cross in self.latest_timestamps and timestamp < self.latest_timestamps[cross]:
-                print(f"{timestamp} {cross.replace('/', ' ')} {price}")
-                print("ignoring out-of-sequence message")
+                lines.append(f"{to_datetime(timestamp)} {display} {price}")
+                lines.append("ignoring out-of-sequence message")
                 continue
 
             # Update the latest timestamp for this market
             self.latest_timestamps[cross] = timestamp
 
-            # Print the received quote
-            print(f"{timestamp} {cross.replace('/', ' ')} {price}")
+            # Log the received quote
+            lines.append(f"{to_datetime(timestamp)} {display} {price}")
 
-            # Update the quotes dictionary
-            self.quotes_dict[cross] = {'price': price, 'time': timestamp}
+            # Update the quotes dictionary; the timestamp goes into the
+            # sweep array at this cross's slot
+            curr_a, curr_b = pair
+            self.quotes_dict[cross] = Quote(price, pair, display)
+            # Resolve the slot before touching self.ts: _pair_index may
+            # rebind the array when it grows
+            pid = self._pair_index(cross)
+            self.ts[pid] = timestamp
 
-    def remove_stale_quotes(self):
-        """
-        Remove stale quotes from the quotes dictionary.
-
-        A quote is considered stale if it is older than the defined QUOTE_EXPIRY time.
-        """
+            # Update the graph in place: only this quote's two edges change
+            self.bf.add_edge(curr_a, curr_b, -log_price)
+            self.bf.add_edge(curr_b, curr_a, log_price)
 
-        current_time = datetime.utcnow()
-        for cross in list(self.quotes_dict.keys()):
-            quote_time = self.quotes_dict[cross]['time']
-            if current_time - quote_time > QUOTE_EXPIRY:
-                print(f"removing stale quote for {cross}")
-                del self.quotes_dict[cross]
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
 
-    def build_graph(self):
+    def remove_stale_quotes(self):
         """
-        Build the currency graph using the current exchange rate quotes.
+        Remove stale quotes from the quotes dictionary and drop their
+        edges from the currency graph.
 
-        Returns:
-            bf (BellmanFord): An instance of the BellmanFord class representing the currency graph.
-
-        The graph's edges are weighted by the negative logarithm of the exchange rates.
+        A quote is considered stale if it is older than the defined
+        QUOTE_EXPIRY_US window.
         """
 
-        bf = BellmanFord()
-        for cross in self.quotes_dict:
-            rate = self.quotes_dict[cross]['price']
-            curr_a, curr_b = cross.split('/')
-            # Use the negative logarithm of the exchange rate as the edge weight
-            weight = -math.log(rate)
-
-            # Add the forward edge
-            bf.add_edge(curr_a, curr_b, weight)
-
-            # Add the reverse edge
-            reverse_weight = -math.log(1 / rate)
-            bf.add_edge(curr_b, curr_a, reverse_weight)
-        return bf
+        # One vectorized compare over the timestamp array picks out every
+        # stale slot at once; only those few pairs then pay the Python
+        # cost of edge removal. Inactive slots sit at -inf and are
+        # excluded by the finite check.
+        cutoff = time.time() * 1e6 - QUOTE_EXPIRY_US
+        stale = np.nonzero((self.ts < cutoff) & np.isfinite(self.ts))[0]
+        for pid in stale:
+            cross = self.pair_list[pid]
+            print(f"removing stale quote for {cross}")
+            curr_a, curr_b = self.quotes_dict[cross].pair
+            self.bf.discard_edge(curr_a, curr_b)
+            self.bf.discard_edge(curr_b, curr_a)
+            del self.quotes_dict[cross]
+            self.ts[pid] = -np.inf
 
     def find_arbitrage(self, bf):
         """
@@ -174,10 +262,11 @@ class ForexSubscriber:
             bf (BellmanFord): The currency graph.
 
         Returns:
-            negative_cycle_edge (tuple): A tuple (u, v) representing an edge in
-                                         a detected negative cycle.
-            predecessor (dict): A dictionary mapping each vertex to its
-                                predecessor in the shortest path.
+            cycle (list): Vertices of the detected negative cycle, already
+                          reconstructed (first vertex repeated at the end).
+            total_weight (float): Sum of edge weights around the cycle,
+                                  i.e. -log of the product of the exchange
+                                  rates along it.
 
         If no negative cycle is detected, (None, None) is returned.
         """
@@ -186,8 +275,7 @@ class ForexSubscriber:
         if start_currency not in bf.vertices:
             return None, None
 
-        distance, predecessor, negative_cycle_edge = bf.shortest_paths(
-            start_currency)
+        distance, predecessor, negative_cycle_edge = bf.spfa(start_currency)
         if negative_cycle_edge:
             cycle = self.reconstruct_negative_cycle(negative_cycle_edge,
                                                     predecessor)
@@ -206,7 +294,7 @@ class ForexSubscriber:
             if total_weight >= EPSILON:
                 return None, None
 
-            return negative_cycle_edge, predecessor
+            return cycle, total_weight
         return None, None
 
     def reconstruct_negative_cycle(self, negative_cycle_edge, predecessor):
@@ -220,33 +308,43 @@ class ForexSubscriber:
                                 algorithm.
 
         Returns:
-            cycle (list): A list of vertices representing the negative cycle.
+            cycle (list): A list of vertices representing the negative
+                          cycle, or None if the backtrack dead-ends or the
+                          cycle does not pass through USD.
 
         The cycle is constructed by backtracking through the predecessors
-        starting from the edge.
+        starting from the edge. Only USD cycles are actionable downstream,
+        so non-USD ones are rejected here instead of being handed back for
+        the callers to re-check and discard.
         """
 
         u, v = negative_cycle_edge
         cycle = [v]
+        seen = {v}  # set membership is O(1); scanning the list is O(k)
         current = u
-        while current not in cycle:
+        while current not in seen:
             cycle.append(current)
+            seen.add(current)
             current = predecessor.get(current)
             if current is None:
                 # Cannot trace back further
                 return None
         cycle.append(current)
         cycle = cycle[cycle.index(current):]  # Get the cycle part
+        if 'USD' not in cycle:
+            return None
         cycle.reverse()
         return cycle
 
-    def display_arbitrage(self, cycle):
+    def display_arbitrage(self, cycle, total_weight):
         """
         Display the arbitrage opportunity with detailed exchange steps and
         profit.
 
         Parameters:
             cycle (list): A list of currencies forming the arbitrage cycle.
+            total_weight (float): Sum of edge weights around the cycle as
+                                  computed by find_arbitrage.
 
         The method:
             - Attempts both the original and reversed directions of the cycle.
@@ -254,46 +352,53 @@ class ForexSubscriber:
             - Displays the arbitrage opportunity if a positive profit is found.
             - If no profitable direction is found, reports that no profitable
               arbitrage opportunity exists.
-        """
 
-        # Ensure the cycle includes USD
-        if 'USD' not in cycle:
-            print("Negative cycle does not include USD. Skipping.")
-            return
+        Cycles without USD never get this far: reconstruct_negative_cycle
+        already rejects them.
+        """
 
-        # Try both directions
+        # Try both directions; each edge's reverse carries the exactly
+        # negated weight (log vs -log of the same price), so the reversed
+        # cycle's total is just -total_weight
         for direction in ['original', 'reversed']:
             if direction == 'original':
                 test_cycle = cycle[:]
+                test_weight = total_weight
             else:
                 test_cycle = cycle[::-1]
+                test_weight = -total_weight
 
-            # Rotate the cycle to start with USD
-            while test_cycle[0] != 'USD':
-                test_cycle.append(test_cycle.pop(0))
+            # Rotate the cycle to start with USD in one slice instead of
+            # repeated pop(0) shifts (each of which moves the whole list)
+            i = test_cycle.index('USD')
+            test_cycle = test_cycle[i:] + test_cycle[:i]
 
             # Calculate profit
-            profit, amount_log = self.calculate_profit(test_cycle)
+            profit, amount_log = self.calculate_profit(test_cycle, test_weight)
             if profit is not None and profit >= 0.01:
                 self.print_arbitrage(test_cycle, amount_log, profit)
                 return  # Exit after finding a profitable arbitrage
 
         print("No profitable arbitrage opportunity found.")
 
-    def calculate_profit(self, cycle):
+    def calculate_profit(self, cycle, total_weight):
         """
         Calculate the profit for the given cycle.
 
         Parameters:
             cycle (list): A list of currencies forming the arbitrage cycle.
+            total_weight (float): Sum of -log(rate) around the cycle.
 
         Returns:
             profit (float): The profit obtained from executing the arbitrage
                             sequence.
             amount_log (list): A list of strings detailing each exchange step.
 
-        The method calculates the amount obtained at each exchange step,
-        starting with a fixed amount of 100 units of the starting currency.
+        The profit comes straight from the cycle weight Bellman-Ford
+        already summed: the weights are -log(rate), so the product of the
+        rates is exp(-total_weight). The per-step walk below only builds
+        the display log; repeating the multiplies for the profit itself
+        would duplicate that work and re-introduce rounding.
         """
 
         starting_amount = 100.0
@@ -305,20 +410,24 @@ class ForexSubscriber:
             cross = f"{curr_from}/{curr_to}"
             reverse_cross = f"{curr_to}/{curr_from}"
 
-            if cross in self.quotes_dict:
-                rate = self.quotes_dict[cross]['price']
+            # Single .get probe per candidate instead of an 'in' check
+            # followed by a second lookup
+            quote = self.quotes_dict.get(cross)
+            if quote is not None:
+                rate = quote.price
                 rate_direction = 'direct'
-            elif reverse_cross in self.quotes_dict:
-                rate = 1 / self.quotes_dict[reverse_cross]['price']
-                rate_direction = 'reverse'
             else:
-                # Missing rate; cannot complete the cycle
-                return None, None
+                quote = self.quotes_dict.get(reverse_cross)
+                if quote is None:
+                    # Missing rate; cannot complete the cycle
+                    return None, None
+                rate = 1 / quote.price
+                rate_direction = 'reverse'
 
             amount *= rate
             amount_log.append(f"\texchange {curr_from} for {curr_to} at {rate} ({rate_direction}) --> {curr_to} {amount}")
 
-        profit = amount - starting_amount
+        profit = starting_amount * (math.exp(-total_weight) - 1.0)
         return profit, amount_log
 
     def print_arbitrage(self, cycle, amount_log, profit):
@@ -355,32 +464,28 @@ class ForexSubscriber:
 
         try:
             while True:
-                quotes = self.receive_messages()
-                if not quotes:
-                    # No message received, check if subscription expired
-                    if datetime.utcnow() - self.last_message_time > timedelta(minutes=10):
+                crosses, prices, times = self.receive_messages()
+                if not crosses:
+                    # Receive timed out: sweep expiries while idle, then
+                    # check whether the subscription itself has lapsed
+                    self.remove_stale_quotes()
+                    if time.monotonic() - self.last_message_time > SUBSCRIPTION_EXPIRY:
                         print("Subscription expired. Exiting.")
                         break
                     continue
 
-                self.last_message_time = datetime.utcnow()
-                self.process_quotes(quotes)
+                self.last_message_time = time.monotonic()
+                self.process_quotes(crosses, prices, times)
                 self.remove_stale_quotes()
-                bf = self.build_graph()
-                negative_cycle_edge, predecessor = self.find_arbitrage(bf)
-
-                if negative_cycle_edge:
-                    cycle = self.reconstruct_negative_cycle(negative_cycle_edge, predecessor)
-                    if 'USD' in cycle:
-                        self.display_arbitrage(cycle)
-                    else:
-                        print("Negative cycle does not include USD. Skipping.")
+                # find_arbitrage hands back the already-reconstructed
+                # cycle, so no second predecessor backtrack is needed
+                cycle, total_weight = self.find_arbitrage(self.bf)
+
+                if cycle:
+                    self.display_arbitrage(cycle, total_weight)
                 else:
                     print("No arbitrage opportunity detected at this time.")
 
-                # Sleep briefly to avoid tight loop (optional)
-                time.sleep(1)
-
         except KeyboardInterrupt:
             print("Subscriber stopped.")
         finally: